@@ -1,4 +1,5 @@
 import argparse
+import functools
 import gnureadline as readline
 import json
 
@@ -8,6 +9,13 @@ readline.set_auto_history(False)  # Don't add to history
 import os
 import time
 from copy import deepcopy
+
+# orjson parses JSON several times faster than the stdlib; fall back
+# silently when it isn't installed.
+try:
+	import orjson as _orjson
+except ImportError:
+	_orjson = None
 from openai import OpenAI
 from openai import APIError
 from rich.console import Console
@@ -43,13 +51,31 @@ DEFAULT_CONFIG = {
 }
 
 
+def _read_json(file_path):
+	"""Read and parse a JSON file, using orjson when available."""
+	with open(file_path, 'rb') as f:
+		data = f.read()
+	if _orjson is not None:
+		return _orjson.loads(data)
+	return json.loads(data)
+
+
+def _write_json(file_path, data):
+	"""Serialize data to a JSON file, using orjson when available."""
+	if _orjson is not None:
+		with open(file_path, 'wb') as f:
+			f.write(_orjson.dumps(data, option=_orjson.OPT_INDENT_2))
+	else:
+		with open(file_path, 'w', encoding='utf-8') as f:
+			json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 def ensure_config_file():
 	"""Create config file with defaults if it doesn't exist."""
 	if os.path.exists(CONFIG_PATH):
 		return
 	try:
-		with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-			json.dump(DEFAULT_CONFIG, f, ensure_ascii=False, indent=2)
+		_write_json(CONFIG_PATH, DEFAULT_CONFIG)
 	except IOError:
 		print(f"{RESET_COLOR}Warning: Could not write config file at {CONFIG_PATH}. Using defaults only.")
 
@@ -58,9 +84,8 @@ def load_config():
 	"""Load configuration from file or fall back to defaults."""
 	ensure_config_file()
 	try:
-		with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-			data = json.load(f)
-	except (IOError, json.JSONDecodeError):
+		data = _read_json(CONFIG_PATH)
+	except (IOError, ValueError):
 		return deepcopy(DEFAULT_CONFIG)
 	
 	config = deepcopy(DEFAULT_CONFIG)
@@ -89,14 +114,21 @@ MODEL_PRICING = CONFIG.get("pricing", DEFAULT_CONFIG["pricing"])
 SYSTEM_PROMPTS = CONFIG.get("system_prompts", DEFAULT_CONFIG["system_prompts"])
 
 
+@functools.lru_cache(maxsize=32)
+def _model_rates(model):
+	"""Return the (input, output) per-token rates for a model, or None."""
+	pricing = MODEL_PRICING.get(model)
+	if pricing is None:
+		return None
+	return pricing["input"] / 1_000_000, pricing["output"] / 1_000_000
+
+
 def calculate_cost(model, input_tokens, output_tokens):
 	"""Calculate cost based on model and token usage."""
-	if model not in MODEL_PRICING:
+	rates = _model_rates(model)
+	if rates is None:
 		return None
-	pricing = MODEL_PRICING[model]
-	input_cost = (input_tokens / 1_000_000) * pricing["input"]
-	output_cost = (output_tokens / 1_000_000) * pricing["output"]
-	return input_cost + output_cost
+	return input_tokens * rates[0] + output_tokens * rates[1]
 
 
 def format_statistics(input_tokens, output_tokens, total_tokens, cost, elapsed_time):
@@ -161,8 +193,7 @@ def save_system_prompt(chat_name, prompt):
 				print(f"{RESET_COLOR}Warning: Could not remove system prompt file {file_path}")
 		return
 	try:
-		with open(file_path, "w", encoding="utf-8") as f:
-			json.dump({"system_prompt": prompt}, f, ensure_ascii=False, indent=2)
+		_write_json(file_path, {"system_prompt": prompt})
 	except IOError:
 		print(f"{RESET_COLOR}Warning: Could not save system prompt to {file_path}")
 
@@ -173,13 +204,12 @@ def load_system_prompt(chat_name):
 	if not os.path.exists(file_path):
 		return ""
 	try:
-		with open(file_path, "r", encoding="utf-8") as f:
-			data = json.load(f)
-			if isinstance(data, dict):
-				return data.get("system_prompt", "") or ""
-			if isinstance(data, str):
-				return data
-	except (json.JSONDecodeError, IOError):
+		data = _read_json(file_path)
+		if isinstance(data, dict):
+			return data.get("system_prompt", "") or ""
+		if isinstance(data, str):
+			return data
+	except (ValueError, IOError):
 		return ""
 	return ""
 
@@ -190,10 +220,9 @@ def load_chat_config(chat_name):
 	if not os.path.exists(file_path):
 		return {}
 	try:
-		with open(file_path, "r", encoding="utf-8") as f:
-			data = json.load(f)
-			return data if isinstance(data, dict) else {}
-	except (json.JSONDecodeError, IOError):
+		data = _read_json(file_path)
+		return data if isinstance(data, dict) else {}
+	except (ValueError, IOError):
 		return {}
 
 
@@ -201,8 +230,7 @@ def save_chat_config(chat_name, config):
 	"""Saves per-chat configuration."""
 	file_path = get_chat_config_path(chat_name)
 	try:
-		with open(file_path, "w", encoding="utf-8") as f:
-			json.dump(config, f, ensure_ascii=False, indent=2)
+		_write_json(file_path, config)
 	except IOError:
 		print(f"{RESET_COLOR}Warning: Could not save chat config to {file_path}")
 
@@ -221,8 +249,7 @@ def load_statistics(chat_name):
 		}
 	
 	try:
-		with open(file_path, 'r', encoding='utf-8') as f:
-			data = json.load(f)
+		data = _read_json(file_path)
 		# Ensure all required fields exist
 		stats = {
 			"total_input_tokens": data.get("total_input_tokens", 0),
@@ -233,7 +260,7 @@ def load_statistics(chat_name):
 			"request_count": data.get("request_count", 0)
 		}
 		return stats
-	except (json.JSONDecodeError, IOError):
+	except (ValueError, IOError):
 		# Return default stats if file is corrupted
 		return {
 			"total_input_tokens": 0,
@@ -249,8 +276,7 @@ def save_statistics(chat_name, stats):
 	"""Saves statistics to file."""
 	file_path = get_stats_path(chat_name)
 	try:
-		with open(file_path, 'w', encoding='utf-8') as f:
-			json.dump(stats, f, ensure_ascii=False, indent=2)
+		_write_json(file_path, stats)
 	except IOError:
 		print(f"{RESET_COLOR}Error: Could not save statistics to {file_path}")
 
@@ -275,15 +301,28 @@ def update_statistics(chat_name, input_tokens, output_tokens, total_tokens, cost
 	save_statistics(chat_name, stats)
 
 
+# Parsed conversations keyed by file path; entries invalidate themselves
+# when the file's mtime or size changes, so repeated loads of an
+# unchanged chat cost one stat instead of a read + parse
+_conv_cache = {}
+
+
 def load_conversation(chat_name):
 	"""Loads all conversation messages from file."""
 	file_path = get_conversation_path(chat_name)
-	if not os.path.exists(file_path):
+	try:
+		stat = os.stat(file_path)
+	except OSError:
 		return []
-	
+
+	stamp = (stat.st_mtime, stat.st_size)
+	cached = _conv_cache.get(file_path)
+	if cached is not None and cached[0] == stamp:
+		# Shallow copy so callers appending messages don't mutate the cache
+		return list(cached[1])
+
 	try:
-		with open(file_path, 'r', encoding='utf-8') as f:
-			data = json.load(f)
+		data = _read_json(file_path)
 		# Handle legacy format where file might contain a string instead of list
 		if isinstance(data, str):
 			return []
@@ -291,8 +330,9 @@ def load_conversation(chat_name):
 		if not isinstance(data, list):
 			return []
 		# Return all messages (we'll use last 10 for API, but save all)
-		return data
-	except (json.JSONDecodeError, IOError):
+		_conv_cache[file_path] = (stamp, data)
+		return list(data)
+	except (ValueError, IOError):
 		return []
 
 
@@ -300,8 +340,7 @@ def save_conversation(chat_name, messages):
 	"""Saves conversation to file."""
 	file_path = get_conversation_path(chat_name)
 	try:
-		with open(file_path, 'w', encoding='utf-8') as f:
-			json.dump(messages, f, ensure_ascii=False, indent=2)
+		_write_json(file_path, messages)
 	except IOError:
 		print(f"{RESET_COLOR}Error: Could not save conversation to {file_path}")
 
@@ -535,8 +574,9 @@ def main():
 
 		messages.append({"role": "user", "content":user_input})
 
-		# Use only last 10 messages for API to avoid token limits
-		api_messages = messages[-10:] if len(messages) > 10 else messages.copy()
+		# Use only last 10 messages for API to avoid token limits;
+		# a slice always returns a new list
+		api_messages = messages[-10:]
 		# Remove 'model' and 'timestamp' fields from messages before sending to API
 		api_messages = [{k: v for k, v in msg.items() if k not in ("model", "timestamp")} for msg in api_messages]
 		
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Warm the bytecode cache for the CLI entry points.
+
+Running this once after install (or in a container image build) means the
+first `tuigpt.py` / `gptcli.py` launch skips parse+compile of the whole
+ui package. Set PYTHONPYCACHEPREFIX if the cache should persist outside
+the source tree.
+"""
+
+import compileall
+import sys
+
+
+def main():
+	ok = True
+	for target in ("gptcli.py", "tuigpt.py"):
+		ok = compileall.compile_file(target, quiet=1) and ok
+	ok = compileall.compile_dir("ui", quiet=1) and ok
+	return 0 if ok else 1
+
+
+if __name__ == "__main__":
+	sys.exit(main())
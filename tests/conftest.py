@@ -0,0 +1,248 @@
+"""
+Shared test configuration.
+
+Builds stub modules for the external dependencies (rich, openai,
+gnureadline, textual) once and installs them into sys.modules via
+mock.patch.dict before any test module imports gptcli or the widgets.
+A session-scoped autouse fixture owns the patcher so the stubs are
+restored when the session ends.
+"""
+import os
+import sys
+import types
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+
+
+# --- Rich stubs ---
+rich_module = types.ModuleType("rich")
+rich_console = types.ModuleType("rich.console")
+rich_markdown = types.ModuleType("rich.markdown")
+rich_progress = types.ModuleType("rich.progress")
+rich_live = types.ModuleType("rich.live")
+rich_text = types.ModuleType("rich.text")
+
+
+class DummyConsole:
+    def print(self, *args, **kwargs):
+        pass
+
+
+class DummyMarkdown(str):
+    def __new__(cls, text):
+        return str.__new__(cls, text)
+
+
+class DummyProgress:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def add_task(self, *args, **kwargs):
+        return 1
+
+
+class DummyLive:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def update(self, *args, **kwargs):
+        pass
+
+
+class DummyText(str):
+    def __new__(cls, text, *args, **kwargs):
+        return str.__new__(cls, text)
+
+
+rich_console.Console = DummyConsole
+rich_markdown.Markdown = DummyMarkdown
+rich_progress.Progress = DummyProgress
+rich_progress.SpinnerColumn = lambda *args, **kwargs: None
+rich_progress.TextColumn = lambda *args, **kwargs: None
+rich_progress.TimeElapsedColumn = lambda *args, **kwargs: None
+rich_live.Live = DummyLive
+rich_text.Text = DummyText
+
+# --- OpenAI stubs ---
+openai_module = types.ModuleType("openai")
+
+
+class DummyAPIError(Exception):
+    def __init__(self, message="error", *args, **kwargs):
+        super().__init__(message)
+        self.message = message
+
+
+class DummyOpenAI:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    class responses:
+        @staticmethod
+        def create(*args, **kwargs):
+            raise NotImplementedError
+
+
+openai_module.OpenAI = DummyOpenAI
+openai_module.APIError = DummyAPIError
+
+# --- gnureadline stubs ---
+gnureadline_module = types.ModuleType("gnureadline")
+
+
+def dummy_set_history_length(*args, **kwargs):
+    pass
+
+
+def dummy_set_auto_history(*args, **kwargs):
+    pass
+
+
+gnureadline_module.set_history_length = dummy_set_history_length
+gnureadline_module.set_auto_history = dummy_set_auto_history
+
+# --- Textual stubs ---
+textual_module = types.ModuleType("textual")
+textual_app = types.ModuleType("textual.app")
+textual_containers = types.ModuleType("textual.containers")
+textual_widgets = types.ModuleType("textual.widgets")
+textual_binding = types.ModuleType("textual.binding")
+textual_message = types.ModuleType("textual.message")
+textual_screen = types.ModuleType("textual.screen")
+textual_events = types.ModuleType("textual.events")
+
+
+class DummyApp:
+    pass
+
+
+class DummyStyles:
+    def __init__(self):
+        self.border_left = None
+
+
+class DummyContainer:
+    def __init__(self, *args, **kwargs):
+        self.mount = Mock()
+        self.is_attached = True
+        self.styles = DummyStyles()
+
+
+class DummyWidget:
+    def __init__(self, *args, **kwargs):
+        self.styles = DummyStyles()
+        self._args = args
+        self._kwargs = kwargs
+        # Precompute the display string so __str__ is a plain attribute read
+        if args and isinstance(args[0], str):
+            self._str = args[0]
+        else:
+            self._str = f"DummyWidget({args[0] if args else ''})"
+
+    def __str__(self):
+        return self._str
+
+
+class DummyBinding:
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+class DummyMessage:
+    pass
+
+
+class DummyModalScreen:
+    pass
+
+
+class DummyKey:
+    pass
+
+
+class DummyEvents:
+    Key = DummyKey
+
+
+# ComposeResult is a type alias, use a simple type
+ComposeResult = type(None)
+
+textual_app.App = DummyApp
+textual_app.ComposeResult = ComposeResult
+textual_containers.Container = DummyContainer
+textual_containers.ScrollableContainer = DummyContainer
+textual_containers.Vertical = DummyContainer
+textual_containers.Horizontal = DummyContainer
+textual_containers.Center = DummyContainer
+textual_widgets.ListView = DummyWidget
+textual_widgets.ListItem = DummyWidget
+textual_widgets.Static = DummyWidget
+textual_widgets.Markdown = DummyWidget
+textual_widgets.Label = DummyWidget
+textual_widgets.Button = DummyWidget
+textual_widgets.Input = DummyWidget
+textual_widgets.TextArea = DummyWidget
+textual_binding.Binding = DummyBinding
+textual_message.Message = DummyMessage
+textual_screen.ModalScreen = DummyModalScreen
+textual_events.events = DummyEvents
+textual_events.Key = DummyKey
+
+_STUB_MODULES = {
+    "rich": rich_module,
+    "rich.console": rich_console,
+    "rich.markdown": rich_markdown,
+    "rich.progress": rich_progress,
+    "rich.live": rich_live,
+    "rich.text": rich_text,
+    "openai": openai_module,
+    "gnureadline": gnureadline_module,
+    "textual": textual_module,
+    "textual.app": textual_app,
+    "textual.containers": textual_containers,
+    "textual.widgets": textual_widgets,
+    "textual.binding": textual_binding,
+    "textual.message": textual_message,
+    "textual.screen": textual_screen,
+    "textual.events": textual_events,
+}
+
+# Ensure dummy API key so gptcli import succeeds without real credentials
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+# Install the stubs immediately: test modules import gptcli and the widget
+# modules at collection time, before any fixture has a chance to run.
+_stub_patcher = mock.patch.dict(sys.modules, _STUB_MODULES)
+_stub_patcher.start()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stub_external_modules():
+    """Keep the dependency stubs installed for the whole session."""
+    yield
+    _stub_patcher.stop()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Pin all widget-logic tests to one xdist worker.
+
+    They share the cached widget module imports, so keeping them together
+    means each worker loads the widget modules at most once.
+    """
+    for item in items:
+        if item.path.name == "test_widgets_logic.py":
+            item.add_marker(pytest.mark.xdist_group("widget_logic"))
@@ -129,6 +129,12 @@ spec.loader.exec_module(ui_utils)
 get_available_chats = ui_utils.get_available_chats
 format_chat_entry = ui_utils.format_chat_entry
 
+# Long-name fixtures built once at import time instead of per test
+_LONG_NAME_100 = "a" * 100
+_LONG_NAME_150 = "a" * 150
+_EXACT_24 = "a" * 24
+_LONG_25 = "a" * 25
+
 
 class TestUIUtilsExtended(unittest.TestCase):
     """Extended tests for UI utility functions - edge cases."""
@@ -184,8 +190,7 @@ class TestUIUtilsExtended(unittest.TestCase):
 
     def test_get_available_chats_very_long_names(self):
         """Test getting chats with very long names."""
-        long_name = "a" * 100
-        chat_file = os.path.join(self.conversations_dir, f"{long_name}.json")
+        chat_file = os.path.join(self.conversations_dir, f"{_LONG_NAME_100}.json")
         with open(chat_file, 'w') as f:
             json.dump([{"role": "user", "content": "test"}], f)
 
@@ -194,7 +199,7 @@ class TestUIUtilsExtended(unittest.TestCase):
             gptcli.CONVERSATIONS_DIR = self.conversations_dir
             chats = get_available_chats()
             self.assertEqual(len(chats), 1)
-            self.assertEqual(chats[0]["name"], long_name)
+            self.assertEqual(chats[0]["name"], _LONG_NAME_100)
         finally:
             gptcli.CONVERSATIONS_DIR = original_dir
 
@@ -228,15 +233,14 @@ class TestUIUtilsExtended(unittest.TestCase):
 
     def test_format_chat_entry_very_long_name(self):
         """Test formatting chat entry with very long name (>100 chars)."""
-        very_long_name = "a" * 150
         chat = {
-            "name": very_long_name,
+            "name": _LONG_NAME_150,
             "model": "gpt-5.1",
             "message_count": 10
         }
         formatted = format_chat_entry(chat)
         # Should return full name without truncation
-        self.assertEqual(very_long_name, formatted)
+        self.assertEqual(_LONG_NAME_150, formatted)
 
     def test_format_chat_entry_different_message_counts(self):
         """Test formatting chat entry with different message counts (should ignore counts)."""
@@ -254,27 +258,25 @@ class TestUIUtilsExtended(unittest.TestCase):
 
     def test_format_chat_entry_exact_24_chars(self):
         """Test formatting chat entry with name exactly 24 characters."""
-        exact_name = "a" * 24
         chat = {
-            "name": exact_name,
+            "name": _EXACT_24,
             "model": "gpt-5.1",
             "message_count": 10
         }
         formatted = format_chat_entry(chat)
         # Should return full name
-        self.assertEqual(exact_name, formatted)
+        self.assertEqual(_EXACT_24, formatted)
 
     def test_format_chat_entry_25_chars(self):
         """Test formatting chat entry with name 25 characters (should not be truncated)."""
-        long_name = "a" * 25
         chat = {
-            "name": long_name,
+            "name": _LONG_25,
             "model": "gpt-5.1",
             "message_count": 10
         }
         formatted = format_chat_entry(chat)
         # Should return full name without truncation
-        self.assertEqual(long_name, formatted)
+        self.assertEqual(_LONG_25, formatted)
 
 
 if __name__ == '__main__':
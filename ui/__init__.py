@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """
 UI package for GPT CLI application.
-"""
 
-from .app import GptCliApp
-from .utils import get_available_chats, format_chat_entry
+Exports are resolved lazily (PEP 562) so importing `ui` doesn't pull in
+Textual until `GptCliApp` is actually requested.
+"""
 
 __all__ = [
 	"GptCliApp",
@@ -12,3 +12,12 @@ __all__ = [
 	"format_chat_entry",
 ]
 
+
+def __getattr__(name):
+	if name == "GptCliApp":
+		from .app import GptCliApp
+		return GptCliApp
+	if name in ("get_available_chats", "format_chat_entry"):
+		from . import utils
+		return getattr(utils, name)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,28 +3,64 @@
 Main application for GPT CLI UI.
 """
 
+import functools
 import os
 import time
-import threading
 from pathlib import Path
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Static
-from openai import APIError
-from rich.text import Text
 
-import gptcli
-from .widgets.chat_list_panel import ChatListPanel
-from .widgets.chat_details_panel import ChatDetailsPanel
-from .widgets.conversation_panel import ConversationPanel, AnimatedThinkingMessage
-from .widgets.input_panel import InputPanel
+# Widget, OpenAI, Rich and gptcli imports are deferred to the methods that
+# use them so importing this module doesn't pull the whole dependency graph
+# upfront.
+
+
+# Metadata fields stripped from messages before they are sent to the API
+_EXCLUDED_FIELDS = frozenset({"model", "timestamp", "request_timestamp", "response_timestamp", "statistics"})
+
+
+def _config_stamp(chat_name: str):
+	"""Return the (config, prompt) file mtimes for cache invalidation."""
+	import gptcli
+	stamps = []
+	for path in (gptcli.get_chat_config_path(chat_name), gptcli.get_system_prompt_path(chat_name)):
+		try:
+			stamps.append(os.path.getmtime(path))
+		except OSError:
+			stamps.append(None)
+	return tuple(stamps)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolved_chat_settings(chat_name: str, stamp: tuple):
+	"""Resolve (model, system prompt) for a chat.
+
+	The result only changes when the config or prompt file does, so it is
+	memoized on their mtimes instead of re-read for every message.
+	"""
+	import gptcli
+	config = gptcli.load_chat_config(chat_name)
+	model = config.get("model", gptcli.DEFAULT_MODEL)
+	custom_prompt = gptcli.load_system_prompt(chat_name)
+	if custom_prompt:
+		system_prompt = custom_prompt
+	else:
+		configured = config.get("system_prompt")
+		if configured:
+			system_prompt = gptcli.SYSTEM_PROMPTS.get(configured, configured)
+		else:
+			system_prompt = None
+	return model, system_prompt
 
 
 class GptCliApp(App):
 	"""Main Textual application for GPT CLI."""
 	
-	# CSS_PATH should be relative to the module file location
-	CSS_PATH = str(Path(__file__).parent / "styles.css")
+	# Read the stylesheet once at import; in-memory CSS takes precedence
+	# over CSS_PATH and avoids a file read per App() construction.
+	CSS = (Path(__file__).parent / "styles.css").read_text()
 	
 	BINDINGS = [
 		("q", "quit", "Quit"),
@@ -32,9 +68,19 @@ class GptCliApp(App):
 		("escape", "quit", "Quit"),
 		("r", "refresh_chats", "Refresh chats"),
 	]
+
+	# Async OpenAI client, created on first request
+	_async_client = None
+
+	# Pending debounce timer for chat-list refreshes
+	_refresh_timer = None
 	
 	def compose(self) -> ComposeResult:
 		"""Create child widgets for the app."""
+		from .widgets.chat_list_panel import ChatListPanel
+		from .widgets.chat_details_panel import ChatDetailsPanel
+		from .widgets.conversation_panel import ConversationPanel
+		from .widgets.input_panel import InputPanel
 		with Horizontal():
 			with Vertical(id="left-panel"):
 				yield ChatListPanel(id="chat-list-panel")
@@ -43,30 +89,66 @@ class GptCliApp(App):
 				yield ConversationPanel(id="conversation-panel")
 				yield InputPanel(id="input-panel")
 	
+	def get_css_variables(self) -> dict:
+		"""Expose the configured message colors as CSS variables.
+
+		Message widgets pick their border color up from the stylesheet
+		instead of per-widget styles assignments, so the color is resolved
+		once here rather than once per mounted message.
+		"""
+		import gptcli
+		variables = super().get_css_variables()
+		variables["user-border"] = gptcli.USER_COLOR or "cyan"
+		variables["assistant-border"] = gptcli.ASSISTANT_COLOR or "green"
+		return variables
+
 	def action_quit(self) -> None:
 		"""Quit the application."""
 		self.exit()
 	
 	def action_refresh_chats(self) -> None:
-		"""Refresh the chat list."""
-		chat_list_panel = self.query_one("#chat-list-panel", ChatListPanel)
-		chat_list_panel.load_chats()
+		"""Refresh the chat list, debounced so key repeats coalesce."""
+		if self._refresh_timer is not None:
+			self._refresh_timer.stop()
+		self._refresh_timer = self.set_timer(0.3, self._do_refresh)
+
+	def _do_refresh(self) -> None:
+		"""Perform the debounced chat list refresh."""
+		self._refresh_timer = None
+		self._chat_list_panel.load_chats()
 	
 	def on_mount(self) -> None:
 		"""Focus on chat list when app starts."""
+		from .widgets.chat_list_panel import ChatListPanel
+		from .widgets.chat_details_panel import ChatDetailsPanel
+		from .widgets.conversation_panel import ConversationPanel
+		from .widgets.input_panel import InputPanel
+		# Resolve the panels once; the send/receive paths reuse these
+		# references instead of walking the DOM with query_one each time.
+		self._chat_list_panel = self.query_one("#chat-list-panel", ChatListPanel)
+		self._details_panel = self.query_one("#chat-details-panel", ChatDetailsPanel)
+		self._conversation_panel = self.query_one("#conversation-panel", ConversationPanel)
+		self._input_panel = self.query_one("#input-panel", InputPanel)
+		# Per-chat locks serializing conversation writes
+		self._chat_locks = {}
 		chat_list = self.query_one("#chat-list")
 		chat_list.focus()
-		# Update details panel if a chat is selected
-		chat_list_panel = self.query_one("#chat-list-panel", ChatListPanel)
-		details_panel = self.query_one("#chat-details-panel", ChatDetailsPanel)
-		chat_data = chat_list_panel.get_selected_chat()
+		# Defer the details sync until the first layout pass has completed
+		# so mount isn't interleaved with extra redraws
+		self.call_after_refresh(self._initial_details_sync)
+
+	def _initial_details_sync(self) -> None:
+		"""Update details panel for the initially selected chat, if any."""
+		chat_data = self._chat_list_panel.get_selected_chat()
 		if chat_data:
-			details_panel.update_chat_details(chat_data)
+			self._details_panel.update_chat_details(chat_data)
 	
 	def send_message_to_api(self, chat_name: str, user_message: str) -> None:
 		"""Send message to API and update UI - async version."""
+		import gptcli
+		from .widgets.conversation_panel import AnimatedThinkingMessage
 		# Update UI immediately - show user message
-		conversation_panel = self.query_one("#conversation-panel", ConversationPanel)
+		conversation_panel = self._conversation_panel
 		
 		# Load conversation
 		messages = gptcli.load_conversation(chat_name)
@@ -74,170 +156,207 @@ class GptCliApp(App):
 		# Add user message with timestamp
 		from datetime import datetime
 		request_timestamp = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-		messages.append({"role": "user", "content": user_message, "request_timestamp": request_timestamp})
-		
-		# Save conversation immediately
-		gptcli.save_conversation(chat_name, messages)
-		
-		# Update UI directly - show user message and loading indicator
-		conversation_panel.load_conversation(chat_name)
-		loading_widget = AnimatedThinkingMessage(classes="loading-message")
-		conversation_panel.conversation_container.mount(loading_widget)
-		# Scroll to bottom after a brief delay to ensure widgets are rendered
-		conversation_panel.set_timer(0.1, lambda: conversation_panel.scroll_end(animate=False))
+		user_entry = {"role": "user", "content": user_message, "request_timestamp": request_timestamp}
+		messages.append(user_entry)
+
+		# Update UI directly - show user message and loading indicator.
+		# The save happens in the worker, off the UI thread; the message is
+		# appended to the already-rendered conversation so the display
+		# doesn't depend on the file write.
+		with self.batch_update():
+			conversation_panel.append_message(user_entry, chat_name)
+			loading_widget = AnimatedThinkingMessage(classes="loading-message")
+			conversation_panel.conversation_container.mount(loading_widget)
+		# Anchor to the bottom; survives however many layout passes the
+		# new widgets need, unlike a one-shot scroll_end
+		conversation_panel.request_scroll_to_bottom()
 		
 		# Start async API call
 		self._send_message_async(chat_name, user_message, messages)
 	
-	def _send_message_async(self, chat_name: str, user_message: str, messages: list) -> None:
-		"""Send message to API asynchronously in a thread."""
-		def run_in_thread():
-			"""Run API call in separate thread."""
-			# Get chat config
-			config = gptcli.load_chat_config(chat_name)
-			model = config.get("model", gptcli.DEFAULT_MODEL)
-			
-			# Get system prompt
-			custom_prompt = gptcli.load_system_prompt(chat_name)
-			if custom_prompt:
-				current_system_prompt = custom_prompt
-			else:
-				system_prompt = config.get("system_prompt")
-				if system_prompt:
-					if system_prompt in gptcli.SYSTEM_PROMPTS:
-						current_system_prompt = gptcli.SYSTEM_PROMPTS[system_prompt]
-					else:
-						current_system_prompt = system_prompt  # Custom prompt
-				else:
-					current_system_prompt = None
-			
-			# Prepare API messages (last 10)
-			api_messages = messages[-10:] if len(messages) > 10 else messages.copy()
-			# Remove metadata fields from messages before sending to API
-			excluded_fields = ("model", "timestamp", "request_timestamp", "response_timestamp", "statistics")
-			api_messages = [{k: v for k, v in msg.items() if k not in excluded_fields} for msg in api_messages]
-			
+	@work(exclusive=True, group="api")
+	async def _send_message_async(self, chat_name: str, user_message: str, messages: list) -> None:
+		"""Send message to API on the event loop via the async client."""
+		import asyncio
+		import gptcli
+		from openai import APIError, AsyncOpenAI
+		# Everything - including the pre-API save and message prep - runs
+		# under the handler, so any failure still clears the spinner and
+		# re-arms the input guard via _update_ui_after_error
+		try:
+			if self._async_client is None:
+				self._async_client = AsyncOpenAI()
+
+			# Serialize writes per chat so saves never interleave, and run
+			# them in a thread so the event loop never blocks on disk
+			lock = self._chat_locks.setdefault(chat_name, asyncio.Lock())
+			async with lock:
+				await asyncio.to_thread(gptcli.save_conversation, chat_name, messages)
+			# Model and system prompt are invariant until the config changes,
+			# so resolve them through the mtime-keyed cache
+			model, current_system_prompt = _resolved_chat_settings(chat_name, _config_stamp(chat_name))
+
+			# Prepare API messages (last 10), stripping metadata fields;
+			# messages without any metadata (the common case) are reused
+			# as-is instead of being rebuilt
+			api_messages = [
+				msg if not (msg.keys() & _EXCLUDED_FIELDS)
+				else {k: v for k, v in msg.items() if k not in _EXCLUDED_FIELDS}
+				for msg in messages[-10:]
+			]
+
 			# Add system prompt if set
 			if current_system_prompt:
 				if not api_messages or api_messages[0].get("role") != "system":
 					api_messages = [{"role": "system", "content": current_system_prompt}] + api_messages
 				else:
-					api_messages[0]["content"] = current_system_prompt
-			
+					# Copy before overwriting - the dict may be shared with `messages`
+					api_messages[0] = {**api_messages[0], "content": current_system_prompt}
+
 			# Track statistics
 			start_time = time.time()
-			
-			try:
-				# Call API (non-streaming for now)
-				response = gptcli.client.responses.create(
-					model=model,
-					input=api_messages,
-					stream=False
-				)
-				
-				# Extract response text
-				assistant_message = ""
-				if hasattr(response, 'output_text'):
-					if isinstance(response.output_text, list) and len(response.output_text) > 0:
-						assistant_message = str(response.output_text[0].text) if hasattr(response.output_text[0], 'text') else str(response.output_text[0])
+
+			# Call API with streaming so tokens render as they arrive
+			stream = await self._async_client.responses.create(
+				model=model,
+				input=api_messages,
+				stream=True
+			)
+
+			assistant_message = ""
+			streaming_widget = None
+			usage_info = None
+			async for event in stream:
+				# Probe with getattr defaults instead of hasattr chains; one
+				# attribute access per event on the common delta path
+				text = ""
+				delta = getattr(event, 'delta', None)
+				if delta is not None:
+					if isinstance(delta, str):
+						text = delta
 					else:
-						assistant_message = str(response.output_text)
-				elif hasattr(response, 'text'):
-					assistant_message = str(response.text)
+						content = getattr(delta, 'content', None)
+						text = str(content) if content else str(delta)
 				else:
-					assistant_message = str(response)
-				
-				# Calculate statistics
-				elapsed_time = time.time() - start_time
-				input_tokens = 0
-				output_tokens = 0
-				total_tokens = 0
-				cost = 0.0
-				
-				if hasattr(response, 'usage'):
-					usage = response.usage
-					input_tokens = getattr(usage, 'input_tokens', 0) or getattr(usage, 'prompt_tokens', 0) or 0
-					output_tokens = getattr(usage, 'output_tokens', 0) or getattr(usage, 'completion_tokens', 0) or 0
-					total_tokens = getattr(usage, 'total_tokens', 0) or (input_tokens + output_tokens)
-				
-				# Calculate cost
-				if input_tokens > 0 or output_tokens > 0:
-					cost = gptcli.calculate_cost(model, input_tokens, output_tokens)
-				
-				# Prepare statistics dict
-				statistics = {
-					"input_tokens": input_tokens,
-					"output_tokens": output_tokens,
-					"total_tokens": total_tokens,
-					"cost": cost,
-					"elapsed_time": elapsed_time
-				}
-				
-				# Add assistant message to conversation with model info, timestamp and statistics
-				from datetime import datetime
-				response_timestamp = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-				messages.append({
-					"role": "assistant",
-					"content": assistant_message,
-					"model": model,
-					"response_timestamp": response_timestamp,
-					"statistics": statistics
-				})
-				gptcli.save_conversation(chat_name, messages)
-				
-				# Update statistics
-				gptcli.update_statistics(chat_name, input_tokens, output_tokens, total_tokens, cost, elapsed_time)
-				
-				# Update UI from worker thread
-				self.call_from_thread(self._update_ui_after_response, chat_name)
-				
-			except APIError as e:
-				# Update UI with error from worker thread
-				self.call_from_thread(self._update_ui_after_error, chat_name, f"API Error: {str(e)}")
-			except Exception as e:
-				# Update UI with error from worker thread
-				self.call_from_thread(self._update_ui_after_error, chat_name, f"Error: {str(e)}")
-		
-		# Start thread
-		thread = threading.Thread(target=run_in_thread, daemon=True)
-		thread.start()
+					output_text = getattr(event, 'output_text', None)
+					if output_text:
+						text = str(output_text)
+
+				if text:
+					assistant_message += text
+					if streaming_widget is None:
+						# First token: swap the thinking indicator for the live widget
+						streaming_widget = self._start_streaming_message()
+					streaming_widget.update(assistant_message)
+
+				# Check for usage information in events
+				usage = getattr(event, 'usage', None)
+				if usage is None:
+					usage = getattr(getattr(event, 'response', None), 'usage', None)
+				if usage is not None:
+					usage_info = usage
+
+			# Calculate statistics
+			elapsed_time = time.time() - start_time
+			input_tokens = 0
+			output_tokens = 0
+			total_tokens = 0
+			cost = 0.0
+
+			# One attribute access plus dict lookups beats a chain of getattr probes
+			usage_dict = getattr(usage_info, '__dict__', {})
+			input_tokens = usage_dict.get('input_tokens') or usage_dict.get('prompt_tokens') or 0
+			output_tokens = usage_dict.get('output_tokens') or usage_dict.get('completion_tokens') or 0
+			total_tokens = usage_dict.get('total_tokens') or (input_tokens + output_tokens)
+			
+			# Calculate cost
+			if input_tokens > 0 or output_tokens > 0:
+				cost = gptcli.calculate_cost(model, input_tokens, output_tokens)
+			
+			# Prepare statistics dict
+			statistics = {
+				"input_tokens": input_tokens,
+				"output_tokens": output_tokens,
+				"total_tokens": total_tokens,
+				"cost": cost,
+				"elapsed_time": elapsed_time
+			}
+			
+			# Add assistant message to conversation with model info, timestamp and statistics
+			from datetime import datetime
+			response_timestamp = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+			messages.append({
+				"role": "assistant",
+				"content": assistant_message,
+				"model": model,
+				"response_timestamp": response_timestamp,
+				"statistics": statistics
+			})
+			async with lock:
+				await asyncio.to_thread(gptcli.save_conversation, chat_name, messages)
+
+			# Update statistics
+			await asyncio.to_thread(gptcli.update_statistics, chat_name, input_tokens, output_tokens, total_tokens, cost, elapsed_time)
+
+			# Already on the UI loop; drop the scratch streaming widget and
+			# let the incremental reload mount the saved assistant message as
+			# a proper header+content container, keeping the panel's message
+			# list in sync so later reloads don't re-append it
+			if streaming_widget is not None:
+				streaming_widget.remove()
+			self._update_ui_after_response(chat_name)
+
+		except Exception as e:
+			prefix = "API Error" if isinstance(e, APIError) else "Error"
+			self._update_ui_after_error(chat_name, f"{prefix}: {str(e)}")
+	
 	
+	def _start_streaming_message(self):
+		"""Swap the thinking indicator for a Markdown widget fed by deltas."""
+		from textual.widgets import Markdown
+		conversation_panel = self._conversation_panel
+		for child in list(conversation_panel.conversation_container.children):
+			if child.has_class("loading-message"):
+				child.remove()
+		streaming_widget = Markdown("", classes="message assistant-message-content")
+		conversation_panel.conversation_container.mount(streaming_widget)
+		return streaming_widget
+
 	def _update_ui_after_response(self, chat_name: str) -> None:
 		"""Update UI after successful API response."""
-		conversation_panel = self.query_one("#conversation-panel", ConversationPanel)
-		
+		conversation_panel = self._conversation_panel
+
 		# Update UI directly - remove loading indicator and reload conversation
-		conversation_panel.load_conversation(chat_name)
-		# Scroll to bottom - use multiple attempts to ensure it works
-		def force_scroll():
-			try:
-				conversation_panel.scroll_end(animate=False)
-			except:
-				pass
-		conversation_panel.call_after_refresh(force_scroll)
-		conversation_panel.set_timer(0.2, force_scroll)
-		conversation_panel.set_timer(0.5, force_scroll)  # Extra backup
-		
+		with self.batch_update():
+			conversation_panel.load_conversation(chat_name)
+		# Anchor to the bottom once the reloaded widgets have been laid out
+		conversation_panel.request_scroll_to_bottom()
+
+		self._sync_details_and_focus(chat_name)
+
+	def _sync_details_and_focus(self, chat_name: str) -> None:
+		"""Refresh the details panel for chat_name and refocus the input."""
 		# Update details panel (don't refresh chat list to preserve selection)
-		chat_list_panel = self.query_one("#chat-list-panel", ChatListPanel)
-		details_panel = self.query_one("#chat-details-panel", ChatDetailsPanel)
+		chat_list_panel = self._chat_list_panel
+		details_panel = self._details_panel
 		# Get fresh chat data
 		chat_data = chat_list_panel.get_selected_chat()
 		if not chat_data or chat_data["name"] != chat_name:
 			# If selection was lost, restore it
 			chat_list_panel.load_chats(preserve_selection=True)
 			chat_data = chat_list_panel.get_selected_chat()
-		
+
 		if chat_data:
 			details_panel.update_chat_details(chat_data)
-		
-		# Focus back on input
-		input_panel = self.query_one("#input-panel", InputPanel)
-		input_panel.message_input.focus()
-	
+
+		# Focus back on input and re-arm the Enter-to-send guard
+		self._input_panel.message_input.release_send()
+		self._input_panel.message_input.focus()
+
 	def _update_ui_after_error(self, chat_name: str, error_msg: str) -> None:
 		"""Update UI after API error."""
-		conversation_panel = self.query_one("#conversation-panel", ConversationPanel)
+		from rich.text import Text
+		conversation_panel = self._conversation_panel
 		
 		# Remove loading indicator
 		conversation_panel.load_conversation(chat_name)
@@ -245,9 +364,9 @@ class GptCliApp(App):
 		error_text = Text(f"Error: {error_msg}", style="red")
 		error_widget = Static(error_text, classes="error-message")
 		conversation_panel.conversation_container.mount(error_widget)
-		conversation_panel.scroll_end(animate=False)
-		
-		# Focus back on input
-		input_panel = self.query_one("#input-panel", InputPanel)
-		input_panel.message_input.focus()
+		conversation_panel.request_scroll_to_bottom()
+
+		# Focus back on input and re-arm the Enter-to-send guard
+		self._input_panel.message_input.release_send()
+		self._input_panel.message_input.focus()
 
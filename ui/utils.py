@@ -3,37 +3,91 @@
 Utility functions for UI.
 """
 
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 import gptcli
 
+# Chat metadata cache keyed by conversation path; entries hold the
+# (st_mtime, st_size) the metadata was computed from, so a warm refresh
+# is a stat() per chat instead of a full JSON parse.
+_META_CACHE: dict[str, tuple[float, int, dict[str, Any]]] = {}
+
+def count_messages(chat: str) -> int:
+	"""Count the messages in a conversation without parsing its JSON.
+
+	Every message object carries exactly one "role" key, and both writers
+	this app uses (json with indent=2 and orjson) emit the colon directly
+	after a key. A quote inside a string value is always escaped, so it can
+	never be followed by a bare colon - making b'"role":' unambiguous for
+	files this app writes, and the byte scan an exact count.
+	"""
+	conv_path = os.path.join(gptcli.CONVERSATIONS_DIR, f"{chat}.json")
+	try:
+		with open(conv_path, 'rb') as f:
+			if os.fstat(f.fileno()).st_size == 0:
+				return 0
+			with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+				count = 0
+				pos = mapped.find(b'"role":')
+				while pos != -1:
+					count += 1
+					pos = mapped.find(b'"role":', pos + 7)
+				return count
+	except (OSError, ValueError):
+		return 0
+
 
-def get_available_chats():
+def _load_chat_metadata(chat: str) -> dict[str, Any]:
+	"""Load the metadata for a single chat (config + message count)."""
+	conv_path = os.path.join(gptcli.CONVERSATIONS_DIR, f"{chat}.json")
+	try:
+		stat = os.stat(conv_path)
+	except OSError:
+		stat = None
+	if stat is not None:
+		cached = _META_CACHE.get(conv_path)
+		if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+			return cached[2]
+	config = gptcli.load_chat_config(chat)
+	model = config.get("model", gptcli.DEFAULT_MODEL)
+	metadata = {
+		"name": chat,
+		"model": model,
+		"message_count": count_messages(chat)
+	}
+	if stat is not None:
+		_META_CACHE[conv_path] = (stat.st_mtime, stat.st_size, metadata)
+	return metadata
+
+
+def get_available_chats() -> list[dict[str, Any]]:
 	"""Get list of available chats with metadata."""
-	if not os.path.exists(gptcli.CONVERSATIONS_DIR):
+	try:
+		# scandir yields DirEntry objects whose type checks reuse the
+		# directory read, avoiding a stat syscall per entry.
+		with os.scandir(gptcli.CONVERSATIONS_DIR) as entries:
+			chats = [
+				entry.name[:-5] for entry in entries
+				if entry.name.endswith(".json")
+				and not entry.name.endswith(".config.json")
+				and entry.is_file(follow_symlinks=False)
+			]
+	except FileNotFoundError:
+		return []
+	if not chats:
 		return []
-	chats = []
-	for entry in os.listdir(gptcli.CONVERSATIONS_DIR):
-		full_path = os.path.join(gptcli.CONVERSATIONS_DIR, entry)
-		if os.path.isdir(full_path):
-			continue
-		if entry.endswith(".config.json"):
-			continue
-		if entry.endswith(".json"):
-			chats.append(entry[:-5])
-	metadata = []
-	for chat in chats:
-		config = gptcli.load_chat_config(chat)
-		model = config.get("model", gptcli.DEFAULT_MODEL)
-		conversation = gptcli.load_conversation(chat)
-		metadata.append({
-			"name": chat,
-			"model": model,
-			"message_count": len(conversation)
-		})
+	# The per-chat reads are independent file I/O; overlapping them in a
+	# thread pool keeps the total wait close to one disk round-trip
+	# instead of one per chat.
+	with ThreadPoolExecutor(max_workers=min(8, len(chats))) as executor:
+		metadata = list(executor.map(_load_chat_metadata, chats))
 	return sorted(metadata, key=lambda item: item["name"])
 
 
-def format_chat_entry(chat):
+def format_chat_entry(chat: dict[str, Any]) -> str:
 	"""Format chat entry for display in list."""
 	return chat["name"]
 
@@ -1,9 +1,35 @@
+import os
+from typing import Any, Optional
+
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.widgets import Static
 
 import gptcli
 
+# Mtime-keyed caches so a stationary selection doesn't re-read JSON on
+# every highlight; entries invalidate themselves when the file changes
+_config_cache: dict[str, tuple[Optional[float], dict]] = {}
+_stats_cache: dict[str, tuple[Optional[float], dict]] = {}
+_details_cache: dict[str, tuple[tuple, str]] = {}
+
+
+def _mtime(path: str) -> Optional[float]:
+	try:
+		return os.path.getmtime(path)
+	except OSError:
+		return None
+
+
+def _cached_read(cache: dict, path: str, loader, chat_name: str) -> tuple[Optional[float], Any]:
+	mtime = _mtime(path)
+	cached = cache.get(path)
+	if cached is not None and cached[0] == mtime:
+		return cached
+	entry = (mtime, loader(chat_name))
+	cache[path] = entry
+	return entry
+
 
 class ChatDetailsPanel(Container):
 	"""Panel showing chat details and statistics."""
@@ -17,44 +43,55 @@ class ChatDetailsPanel(Container):
 		self.details_content = Static("Select a chat to view details", classes="chat-details-content")
 		yield self.details_content
 	
-	def update_chat_details(self, chat_data):
+	def update_chat_details(self, chat_data: Optional[dict]) -> None:
 		"""Update panel with details of selected chat."""
 		if not chat_data:
 			self.details_content.update("Select a chat to view details")
 			return
 		
 		chat_name = chat_data["name"]
-		config = gptcli.load_chat_config(chat_name)
-		stats = gptcli.load_statistics(chat_name)
-		
-		details = []
-		details.append(f"[bold]Chat:[/bold] {chat_name}")
-		details.append("")
-		details.append("[bold]Settings:[/bold]")
+		config_path = gptcli.get_chat_config_path(chat_name)
+		config_mtime, config = _cached_read(_config_cache, config_path, gptcli.load_chat_config, chat_name)
+		stats_mtime, stats = _cached_read(_stats_cache, gptcli.get_stats_path(chat_name), gptcli.load_statistics, chat_name)
+
+		# Reuse the joined details string when nothing it depends on changed
+		details_key = (config_mtime, stats_mtime, chat_data["message_count"])
+		cached_details = _details_cache.get(config_path)
+		if cached_details is not None and cached_details[0] == details_key:
+			self.details_content.update(cached_details[1])
+			return
+
 		model = config.get("model", gptcli.DEFAULT_MODEL)
-		details.append(f"  Model: {model}")
-		
+
 		system_prompt = config.get("system_prompt")
 		if system_prompt:
 			if system_prompt in gptcli.SYSTEM_PROMPTS:
-				details.append(f"  System Prompt: {system_prompt}")
+				prompt_line = f"  System Prompt: {system_prompt}"
 			else:
 				preview = system_prompt[:40] + "..." if len(system_prompt) > 40 else system_prompt
-				details.append(f"  System Prompt: {preview}")
+				prompt_line = f"  System Prompt: {preview}"
 		else:
-			details.append("  System Prompt: (default)")
-		details.append("")
-		
-		details.append("[bold]Statistics:[/bold]")
-		details.append(f"  Messages: {chat_data['message_count']}")
-		details.append(f"  Requests: {stats['request_count']}")
-		details.append(f"  Total Tokens: {stats['total_tokens']:,}")
-		details.append(f"  Input Tokens: {stats['total_input_tokens']:,}")
-		details.append(f"  Output Tokens: {stats['total_output_tokens']:,}")
-		if stats['total_cost'] > 0:
-			details.append(f"  Total Cost: ${stats['total_cost']:.6f}")
-		if stats['total_time'] > 0:
-			details.append(f"  Total Time: {stats['total_time']:.2f}s")
-		
-		self.details_content.update("\n".join(details))
+			prompt_line = "  System Prompt: (default)"
+
+		cost_line = f"\n  Total Cost: ${stats['total_cost']:.6f}" if stats['total_cost'] > 0 else ""
+		time_line = f"\n  Total Time: {stats['total_time']:.2f}s" if stats['total_time'] > 0 else ""
+
+		# One formatted string instead of a list of line appends + join
+		text = (
+			f"[bold]Chat:[/bold] {chat_name}\n"
+			"\n"
+			"[bold]Settings:[/bold]\n"
+			f"  Model: {model}\n"
+			f"{prompt_line}\n"
+			"\n"
+			"[bold]Statistics:[/bold]\n"
+			f"  Messages: {chat_data['message_count']}\n"
+			f"  Requests: {stats['request_count']}\n"
+			f"  Total Tokens: {stats['total_tokens']:,}\n"
+			f"  Input Tokens: {stats['total_input_tokens']:,}\n"
+			f"  Output Tokens: {stats['total_output_tokens']:,}"
+			f"{cost_line}{time_line}"
+		)
+		_details_cache[config_path] = (details_key, text)
+		self.details_content.update(text)
 
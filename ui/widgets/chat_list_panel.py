@@ -1,3 +1,5 @@
+from bisect import bisect_left
+from contextlib import suppress
 from typing import Optional
 import os
 
@@ -15,15 +17,24 @@ from .delete_chat_modal import DeleteChatModal
 from .edit_system_prompt_modal import EditSystemPromptModal
 
 
+def _bulk_unlink(paths) -> None:
+	"""Remove files in one pass, tolerating ones that don't exist."""
+	for path in paths:
+		with suppress(FileNotFoundError):
+			os.unlink(path)
+
+
 class ChatListItem(ListItem):
 	"""List item for a chat."""
 	
 	def __init__(self, chat_data, *args, **kwargs):
 		super().__init__(*args, **kwargs)
 		self.chat_data = chat_data
-	
+		# The label is immutable per chat_data snapshot; format it once
+		self._label_text = format_chat_entry(chat_data)
+
 	def compose(self) -> ComposeResult:
-		yield Label(format_chat_entry(self.chat_data))
+		yield Label(self._label_text)
 
 
 class ChatListPanel(Container):
@@ -39,32 +50,23 @@ class ChatListPanel(Container):
 		super().__init__(*args, **kwargs)
 		self.border_title = "Chats"
 		self.chat_list_view = None
-		self._last_highlighted = None
-	
+		self._pending_load = None
+		self._index_by_name = {}
+		self._details_panel = None
+		self._conversation_panel = None
+		# Pooled modal instances, built lazily on first use and reused
+		# across pushes instead of constructing a new screen each time
+		self._new_chat_modal = None
+		self._delete_chat_modal = None
+
 	def compose(self) -> ComposeResult:
 		self.chat_list_view = ListView(id="chat-list")
 		yield self.chat_list_view
-	
+
 	def on_mount(self) -> None:
 		"""Load chats when panel is mounted."""
 		self.load_chats()
-		self.set_interval(0.1, self._check_selection_change)
-	
-	def _check_selection_change(self) -> None:
-		"""Check if selection changed and update details and conversation."""
-		current = self.chat_list_view.highlighted_child
-		if current != self._last_highlighted:
-			self._last_highlighted = current
-			self.update_details_on_selection()
-			app = self.app
-			if app:
-				conversation_panel = app.query_one("#conversation-panel", ConversationPanel)
-				chat_data = self.get_selected_chat()
-				if chat_data:
-					conversation_panel.load_conversation(chat_data["name"])
-				else:
-					conversation_panel.load_conversation(None)
-	
+
 	def load_chats(self, preserve_selection: bool = True) -> None:
 		"""Load and display available chats."""
 		selected_chat_name: Optional[str] = None
@@ -75,25 +77,65 @@ class ChatListPanel(Container):
 		
 		chats = get_available_chats()
 		self.chat_list_view.clear()
+		# Name-to-index map makes selection restore O(1)
+		self._index_by_name = {chat["name"]: i for i, chat in enumerate(chats)}
 		for chat in chats:
 			self.chat_list_view.append(ChatListItem(chat))
-		
+
 		if selected_chat_name and preserve_selection:
 			self._restore_selection(selected_chat_name)
-	
+
 	def _restore_selection(self, chat_name: str) -> None:
 		"""Restore selection after loading chats."""
-		for i, item in enumerate(self.chat_list_view.children):
-			if isinstance(item, ChatListItem) and item.chat_data["name"] == chat_name:
-				self.chat_list_view.index = i
-				self.update_details_on_selection()
-				app = self.app
-				if app:
-					conversation_panel = app.query_one("#conversation-panel", ConversationPanel)
-					conversation_panel.load_conversation(chat_name)
-				break
+		index = self._index_by_name.get(chat_name)
+		if index is None:
+			return
+		self.chat_list_view.index = index
+		self.update_details_on_selection()
+		app = self.app
+		if app:
+			conversation_panel = self._get_conversation_panel()
+			conversation_panel.load_conversation(chat_name)
 	
-	def get_selected_chat(self):
+	def _get_details_panel(self) -> ChatDetailsPanel:
+		"""Resolve the details panel once; resolved lazily because the app
+		isn't ready when this panel mounts."""
+		if self._details_panel is None:
+			self._details_panel = self.app.query_one("#chat-details-panel", ChatDetailsPanel)
+		return self._details_panel
+
+	def _get_conversation_panel(self) -> ConversationPanel:
+		"""Resolve the conversation panel once (lazy, see above)."""
+		if self._conversation_panel is None:
+			self._conversation_panel = self.app.query_one("#conversation-panel", ConversationPanel)
+		return self._conversation_panel
+
+	def _insert_chat_item(self, chat_data: dict) -> None:
+		"""Optimistically insert one chat row at its sorted position."""
+		names = list(self._index_by_name)
+		position = bisect_left(names, chat_data["name"])
+		item = ChatListItem(chat_data)
+		if position >= len(names):
+			self.chat_list_view.append(item)
+		else:
+			self.chat_list_view.mount(item, before=position)
+		names.insert(position, chat_data["name"])
+		self._index_by_name = {name: i for i, name in enumerate(names)}
+		self.chat_list_view.index = position
+
+	def _remove_chat_item(self, chat_name: str) -> None:
+		"""Optimistically remove one chat row without a rescan."""
+		index = self._index_by_name.pop(chat_name, None)
+		if index is None:
+			return
+		children = self.chat_list_view.children
+		if index < len(children):
+			children[index].remove()
+		for name, i in self._index_by_name.items():
+			if i > index:
+				self._index_by_name[name] = i - 1
+
+	def get_selected_chat(self) -> Optional[dict]:
 		"""Get currently selected chat data."""
 		if self.chat_list_view.highlighted_child is None:
 			return None
@@ -106,7 +148,7 @@ class ChatListPanel(Container):
 		"""Update details panel when selection changes."""
 		app = self.app
 		if app:
-			details_panel = app.query_one("#chat-details-panel", ChatDetailsPanel)
+			details_panel = self._get_details_panel()
 			chat_data = self.get_selected_chat()
 			details_panel.update_chat_details(chat_data)
 	
@@ -116,17 +158,25 @@ class ChatListPanel(Container):
 		if chat_data:
 			app = self.app
 			if app:
-				conversation_panel = app.query_one("#conversation-panel", ConversationPanel)
+				conversation_panel = self._get_conversation_panel()
 				conversation_panel.load_conversation(chat_data["name"])
 	
 	def on_list_view_highlighted(self, event) -> None:
-		"""Handle chat selection change."""
+		"""Handle chat selection change (event-driven, no polling)."""
 		app = self.app
 		if app:
-			details_panel = app.query_one("#chat-details-panel", ChatDetailsPanel)
+			details_panel = self._get_details_panel()
 			chat_data = self.get_selected_chat()
 			details_panel.update_chat_details(chat_data)
-			
+			# The details update is cheap and stays immediate; the expensive
+			# conversation rebuild is debounced so holding an arrow key only
+			# loads the final resting selection
+			if self._pending_load is not None:
+				self._pending_load.stop()
+			chat_name = chat_data["name"] if chat_data else None
+			conversation_panel = self._get_conversation_panel()
+			self._pending_load = self.set_timer(0.15, lambda: conversation_panel.load_conversation(chat_name))
+
 	def action_new_chat(self) -> None:
 		app = self.app
 		if not app:
@@ -158,8 +208,12 @@ class ChatListPanel(Container):
 			gptcli.save_conversation(chat_name, [])
 			if system_prompt:
 				gptcli.save_system_prompt(chat_name, system_prompt)
-			self.load_chats(preserve_selection=False)
-			self._restore_selection(chat_name)
+			# Optimistic update: insert the one new row instead of
+			# rescanning the directory and rebuilding every item
+			self._insert_chat_item({"name": chat_name, "model": gptcli.DEFAULT_MODEL, "message_count": 0})
+			self.update_details_on_selection()
+			conversation_panel = self._get_conversation_panel()
+			conversation_panel.load_conversation(chat_name)
 			
 			def focus_input():
 				input_panel = app.query_one("#input-panel")
@@ -168,7 +222,11 @@ class ChatListPanel(Container):
 			
 			app.call_after_refresh(focus_input)
 		
-		app.push_screen(NewChatModal(), handle_result)
+		if self._new_chat_modal is None:
+			self._new_chat_modal = NewChatModal()
+		else:
+			self._new_chat_modal.reset()
+		app.push_screen(self._new_chat_modal, handle_result)
 	
 	def action_delete_chat(self) -> None:
 		"""Delete selected chat."""
@@ -189,29 +247,30 @@ class ChatListPanel(Container):
 			if not confirmed:
 				return
 			
-			chat_path = gptcli.get_conversation_path(chat_name)
-			config_path = gptcli.get_chat_config_path(chat_name)
-			stats_path = gptcli.get_stats_path(chat_name)
-			system_prompt_path = gptcli.get_system_prompt_path(chat_name)
-			
-			if os.path.exists(chat_path):
-				os.remove(chat_path)
-			if os.path.exists(config_path):
-				os.remove(config_path)
-			if os.path.exists(stats_path):
-				os.remove(stats_path)
-			if os.path.exists(system_prompt_path):
-				os.remove(system_prompt_path)
-			
-			self.load_chats(preserve_selection=False)
-			
-			conversation_panel = app.query_one("#conversation-panel", ConversationPanel)
+			paths = (
+				gptcli.get_conversation_path(chat_name),
+				gptcli.get_chat_config_path(chat_name),
+				gptcli.get_stats_path(chat_name),
+				gptcli.get_system_prompt_path(chat_name),
+			)
+			# One unlink pass off the UI thread; suppress(FileNotFoundError)
+			# replaces the exists() pre-checks, halving the syscalls
+			self.run_worker(lambda: _bulk_unlink(paths), thread=True)
+
+			# Optimistic update: drop the one removed row
+			self._remove_chat_item(chat_name)
+
+			conversation_panel = self._get_conversation_panel()
 			conversation_panel.load_conversation(None)
 			
-			details_panel = app.query_one("#chat-details-panel", ChatDetailsPanel)
+			details_panel = self._get_details_panel()
 			details_panel.update_chat_details(None)
 		
-		app.push_screen(DeleteChatModal(chat_name), handle_result)
+		if self._delete_chat_modal is None:
+			self._delete_chat_modal = DeleteChatModal(chat_name)
+		else:
+			self._delete_chat_modal.set_chat_name(chat_name)
+		app.push_screen(self._delete_chat_modal, handle_result)
 
 	def action_edit_chat(self) -> None:
 		"""Edit system prompt for selected chat."""
@@ -233,7 +292,7 @@ class ChatListPanel(Container):
 			if new_prompt is None:
 				return
 			gptcli.save_system_prompt(chat_name, new_prompt)
-			details_panel = app.query_one("#chat-details-panel", ChatDetailsPanel)
+			details_panel = self._get_details_panel()
 			details_panel.update_chat_details(chat_data)
 		
 		app.push_screen(EditSystemPromptModal(chat_name, current_prompt), handle_result)
@@ -1,3 +1,6 @@
+import functools
+from typing import Optional
+
 from textual.app import ComposeResult
 from textual.containers import ScrollableContainer, Vertical, Horizontal
 from textual.message import Message
@@ -6,39 +9,70 @@ from rich.text import Text
 
 import gptcli
 
+# Number of trailing messages mounted eagerly; older messages are
+# mounted on demand when the user scrolls back to the top, keeping the
+# initial load O(window) instead of O(history)
+RENDER_WINDOW = 50
+
+# Of the mounted window, only this many trailing assistant messages get a
+# real Markdown widget up front; the rest start as plain-text placeholders
+# and are hydrated when scrolled into view, skipping the markdown parse
+# for bodies nobody is looking at
+EAGER_MARKDOWN = 10
+
+# Characters whose presence suggests the content actually uses markdown;
+# a plain reply without any of them renders through a cheap Static
+_MD_SIGILS = frozenset("`*_#[>|~")
+
+
+def _looks_like_markdown(content: str) -> bool:
+	"""Cheap sigil scan deciding whether content needs the markdown parser."""
+	return any(c in _MD_SIGILS for c in content) or content.startswith("1. ") or "\n1. " in content
+
+
+@functools.lru_cache(maxsize=64)
+def _header_text(name: str, color: str) -> Text:
+	"""Build (once) the styled header Text for a user or model name.
+
+	The same header repeats for every message from the same author, so the
+	rendered Text object is shared across message widgets.
+	"""
+	return Text(name, style=f"bold {color}")
+
 
 class AnimatedThinkingMessage(Static):
 	"""Animated 'Thinking' message with spinner."""
-	
-	SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-	
+
 	def __init__(self, *args, **kwargs):
 		super().__init__(*args, **kwargs)
-		self._spinner_index = 0
 		self._spinner_interval = None
-	
+
 	def on_mount(self) -> None:
 		"""Start animation when widget is mounted."""
-		self._spinner_index = 0
-		self._update_text()
-		# Use smaller interval for smoother animation (0.05s instead of 0.1s)
-		self._spinner_interval = self.set_interval(0.05, self._animate)
-	
+		from rich.spinner import Spinner
+		# Rich's Spinner picks its frame from the clock at render time, so
+		# the renderable is set once and each tick is just a repaint - no
+		# per-frame string formatting or markup parsing
+		self.update(Spinner("dots", text=Text("Thinking", style="yellow")))
+		# 10 FPS is plenty for a terminal spinner and halves the repaint
+		# traffic compared to the previous 20 FPS tick
+		self._spinner_interval = self.set_interval(0.1, self._tick)
+
+	def _tick(self) -> None:
+		"""Repaint the spinner, skipping frames while scrolled offscreen
+		or hidden behind a modal."""
+		if self.screen is not self.app.screen:
+			return
+		region = self.region
+		if not region or region.area == 0:
+			return
+		self.refresh()
+
 	def on_unmount(self) -> None:
 		"""Stop animation when widget is unmounted."""
 		if self._spinner_interval:
 			self._spinner_interval.stop()
 			self._spinner_interval = None
-	
-	def _animate(self) -> None:
-		"""Animate spinner frame."""
-		self._spinner_index = (self._spinner_index + 1) % len(self.SPINNER_FRAMES)
-		self._update_text()
-	
-	def _update_text(self) -> None:
-		"""Update text with current spinner frame."""
-		frame = self.SPINNER_FRAMES[self._spinner_index]
-		self.update(f"[yellow]Thinking {frame}[/yellow]")
 
 
 class ScrollToBottom(Message):
@@ -56,113 +90,209 @@ class ConversationPanel(ScrollableContainer):
 		self.border_title = "Conversation"
 		self.current_chat_name = None
 		self.conversation_container = None
+		self._showing_placeholder = False
+		self._messages = []
+		self._rendered_start = 0
+		self._hydrate_pending = False
 	
 	def compose(self) -> ComposeResult:
 		self.conversation_container = Vertical(id="conversation-container")
 		yield self.conversation_container
 	
+	def request_scroll_to_bottom(self) -> None:
+		"""Pin the panel to the bottom until the user scrolls away.
+
+		A one-shot scroll_end scheduled with call_after_refresh can run
+		before the freshly mounted messages have been laid out (max_scroll_y
+		still 0) and silently no-op; anchoring instead holds the bottom
+		through however many layout passes the new content needs, and
+		releases as soon as the user moves the scroll position.
+		"""
+		self.anchor()
+		# Hydrate once layout settles: anchoring a short conversation may
+		# not move scroll_y at all, so the watcher wouldn't fire
+		if not self._hydrate_pending:
+			self._hydrate_pending = True
+			self.call_after_refresh(self._hydrate_visible_markdown)
+
 	def on_scroll_to_bottom(self, event: ScrollToBottom) -> None:
 		"""Handle scroll to bottom message."""
-		def scroll_to_bottom():
-			try:
-				self.scroll_end(animate=False)
-			except Exception:
-				pass
-		
-		self.call_after_refresh(scroll_to_bottom)
-		self.set_timer(0.1, scroll_to_bottom)
-		self.set_timer(0.3, scroll_to_bottom)
-		self.set_timer(0.5, scroll_to_bottom)
+		self.request_scroll_to_bottom()
 	
-	def load_conversation(self, chat_name):
+	def load_conversation(self, chat_name: Optional[str]) -> None:
 		"""Load and display conversation for selected chat."""
+		# Reloading the chat that's already on screen: if the stored
+		# messages are a prefix of the fresh ones, mount only the tail
+		# instead of rebuilding every widget
+		if chat_name and chat_name == self.current_chat_name and not self._showing_placeholder:
+			messages = gptcli.load_conversation(chat_name)
+			rendered = len(self._messages)
+			if len(messages) >= rendered and messages[:rendered] == self._messages:
+				# The app mounts loading spinners and error banners directly
+				# into the container; a reload is expected to clear them even
+				# when there is no new tail to append
+				self._clear_transient_widgets()
+				tail = messages[rendered:]
+				if tail:
+					fallback_model = None
+					if any(m.get("role") == "assistant" and not m.get("model") for m in tail):
+						fallback_model = gptcli.load_chat_config(chat_name).get("model", gptcli.DEFAULT_MODEL)
+					widgets = [w for m in tail if (w := self._build_message(m, chat_name, fallback_model)) is not None]
+					self.conversation_container.mount_all(widgets)
+					self._messages = messages
+					self.post_message(ScrollToBottom())
+				return
+
 		self.current_chat_name = chat_name
 		self.conversation_container.remove_children()
-		
+
 		if not chat_name:
 			self.conversation_container.mount(Static("Select a chat to view conversation", classes="empty-message"))
+			self._showing_placeholder = True
 			return
-		
+
 		messages = gptcli.load_conversation(chat_name)
-		
+		self._messages = messages
+
 		if not messages:
 			self.conversation_container.mount(Static("No messages in this conversation yet.", classes="empty-message"))
+			self._showing_placeholder = True
 			return
-		
-		for message in messages:
-			role = message.get("role", "user")
-			content = message.get("content", "")
-			
-			if role == "user":
-				user_name = gptcli.USER_NAME or "You"
-				user_color = gptcli.USER_COLOR or "cyan"
-				timestamp = message.get("request_timestamp", "")
-				
-				# Create wrapper container for entire message (header + content)
-				message_container = Vertical()
-				message_container.styles.border_left = ("solid", user_color)
-				message_container.styles.margin_bottom = 2
-				
-				# Mount message container first
-				self.conversation_container.mount(message_container)
-				
-				# Create header with Horizontal container
-				header_container = Horizontal()
-				
-				# Mount header container to message container
-				message_container.mount(header_container)
-				
-				# Create Static with user name inside Horizontal (mounted first)
-				user_header = Text(f"{user_name}", style=f"bold {user_color}")
-				name_widget = Static(user_header, classes="message-header-left")
-				header_container.mount(name_widget)
-				
-				# Create Static with date inside Horizontal
-				date_widget = Static(timestamp, classes="message-header-right")
-				header_container.mount(date_widget)
-				
-				# Create content
-				content_widget = Static(content, classes="message user-message-content")
-				content_widget.styles.margin_top = 1
-				content_widget.styles.padding_top = 1
-				message_container.mount(content_widget)
-			elif role == "assistant":
-				# Get model from message if available, otherwise from config
-				model = message.get("model")
-				if not model:
-					config = gptcli.load_chat_config(chat_name)
-					model = config.get("model", gptcli.DEFAULT_MODEL)
-				assistant_color = gptcli.ASSISTANT_COLOR or "green"
-				timestamp = message.get("response_timestamp", "")
-				
-				# Create wrapper container for entire message (header + content)
-				message_container = Vertical()
-				message_container.styles.border_left = ("solid", assistant_color)
-				message_container.styles.margin_bottom = 2
-				
-				# Mount message container first
-				self.conversation_container.mount(message_container)
-				
-				# Create header with Horizontal container
-				header_container = Horizontal()
-				
-				# Mount header container to message container
-				message_container.mount(header_container)
-				
-				# Create Static with model name inside Horizontal (mounted first)
-				model_header = Text(f"{model}", style=f"bold {assistant_color}")
-				name_widget = Static(model_header, classes="message-header-left")
-				header_container.mount(name_widget)
-				
-				# Create Static with date inside Horizontal
-				date_widget = Static(timestamp, classes="message-header-right")
-				header_container.mount(date_widget)
-				
-				# Create content with Markdown
-				content_widget = Markdown(content, classes="message assistant-message-content")
-				content_widget.styles.margin_top = 1
-				content_widget.styles.padding_top = 1
-				message_container.mount(content_widget)
-		
+
+		self._showing_placeholder = False
+		# Mount only the trailing window; older messages are backfilled
+		# when the user scrolls to the top. Building the widgets first and
+		# mounting them all at once means one layout pass instead of one
+		# per message.
+		self._rendered_start = max(0, len(messages) - RENDER_WINDOW)
+		# Resolve the config-fallback model once for the whole conversation
+		# instead of once per assistant message
+		fallback_model = None
+		if any(m.get("role") == "assistant" and not m.get("model") for m in messages):
+			fallback_model = gptcli.load_chat_config(chat_name).get("model", gptcli.DEFAULT_MODEL)
+		eager_from = max(0, len(messages) - EAGER_MARKDOWN)
+		widgets = []
+		for i, message in enumerate(messages[self._rendered_start:], self._rendered_start):
+			widget = self._build_message(message, chat_name, fallback_model, lazy=i < eager_from)
+			if widget is not None:
+				widgets.append(widget)
+		self.conversation_container.mount_all(widgets)
+
 		self.post_message(ScrollToBottom())
 
+	def _clear_transient_widgets(self) -> None:
+		"""Remove loading spinners and error banners mounted out-of-band."""
+		for child in list(self.conversation_container.children):
+			if child.has_class("loading-message") or child.has_class("error-message"):
+				child.remove()
+
+	def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+		"""Backfill older messages when the user scrolls to the top."""
+		super().watch_scroll_y(old_value, new_value)
+		if new_value == 0 and self._rendered_start > 0:
+			self._backfill_older_messages()
+		# Hydrate placeholders after layout settles; the guard coalesces
+		# the burst of scroll_y changes a wheel flick produces into one pass
+		if not self._hydrate_pending:
+			self._hydrate_pending = True
+			self.call_after_refresh(self._hydrate_visible_markdown)
+
+	def _backfill_older_messages(self) -> None:
+		"""Mount the previous chunk of messages above the current window."""
+		start = max(0, self._rendered_start - RENDER_WINDOW)
+		for i, message in enumerate(self._messages[start:self._rendered_start]):
+			self._mount_message(message, self.current_chat_name, before=i, lazy=True)
+		self._rendered_start = start
+
+	def _hydrate_visible_markdown(self) -> None:
+		"""Swap visible plain-text placeholders for rendered Markdown."""
+		self._hydrate_pending = False
+		own_region = self.region
+		for placeholder in list(self.query(".pending-md")):
+			try:
+				visible = placeholder.region.overlaps(own_region)
+			except Exception:
+				visible = False
+			if not visible:
+				continue
+			parent = placeholder.parent
+			if parent is None:
+				continue
+			markdown = Markdown(placeholder._markdown_source, classes="message assistant-message-content")
+			parent.mount(markdown, after=placeholder)
+			placeholder.remove()
+
+	def append_message(self, message: dict, chat_name: Optional[str] = None) -> None:
+		"""Mount a single message widget without reloading the conversation."""
+		self._messages.append(message)
+		self._mount_message(message, chat_name)
+
+	def _mount_message(self, message: dict, chat_name: Optional[str] = None, before: Optional[int] = None, lazy: bool = False) -> None:
+		"""Build and mount the widgets for a single message."""
+		if self._showing_placeholder:
+			self.conversation_container.remove_children()
+			self._showing_placeholder = False
+		widget = self._build_message(message, chat_name, lazy=lazy)
+		if widget is not None:
+			self.conversation_container.mount(widget, before=before)
+
+	def _build_message(self, message: dict, chat_name: Optional[str] = None, fallback_model: Optional[str] = None, lazy: bool = False):
+		"""Build the widget tree for a single message without mounting it.
+
+		Children are passed to the container constructors, so the whole
+		message mounts as one unit.
+		"""
+		role = message.get("role", "user")
+		content = message.get("content", "")
+
+		if role == "user":
+			user_name = gptcli.USER_NAME or "You"
+			user_color = gptcli.USER_COLOR or "cyan"
+			timestamp = message.get("request_timestamp", "")
+
+			# Header: user name on the left, date on the right
+			name_widget = Static(_header_text(user_name, user_color), classes="message-header-left")
+			date_widget = Static(timestamp, classes="message-header-right")
+
+			content_widget = Static(content, classes="message user-message-content")
+
+			# Wrapper container for the entire message (header + content);
+			# border and spacing come from the stylesheet so mounting doesn't
+			# trigger a per-widget style recompute
+			return Vertical(
+				Horizontal(name_widget, date_widget),
+				content_widget,
+				classes="user-message-container",
+			)
+		elif role == "assistant":
+			# Get model from message if available, otherwise the fallback
+			# resolved once by the caller, otherwise from config
+			model = message.get("model") or fallback_model
+			if not model:
+				config = gptcli.load_chat_config(chat_name)
+				model = config.get("model", gptcli.DEFAULT_MODEL)
+			assistant_color = gptcli.ASSISTANT_COLOR or "green"
+			timestamp = message.get("response_timestamp", "")
+
+			# Header: model name on the left, date on the right
+			name_widget = Static(_header_text(model, assistant_color), classes="message-header-left")
+			date_widget = Static(timestamp, classes="message-header-right")
+
+			if not _looks_like_markdown(content):
+				# No markdown syntax at all - skip the parser entirely
+				content_widget = Static(Text(content), classes="message assistant-message-content")
+			elif lazy:
+				# Plain text stand-in; _hydrate_visible_markdown swaps in a
+				# real Markdown widget once this scrolls into view
+				content_widget = Static(Text(content), classes="message assistant-message-content pending-md")
+				content_widget._markdown_source = content
+			else:
+				content_widget = Markdown(content, classes="message assistant-message-content")
+
+			return Vertical(
+				Horizontal(name_widget, date_widget),
+				content_widget,
+				classes="assistant-message-container",
+			)
+		return None
+	
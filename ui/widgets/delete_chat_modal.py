@@ -11,9 +11,17 @@ class DeleteChatModal(ModalScreen):
 		("escape", "cancel", "Cancel"),
 	]
 	
-	def __init__(self, chat_name: str, *args, **kwargs):
+	def __init__(self, chat_name: str = "", *args, **kwargs):
 		super().__init__(*args, **kwargs)
 		self.chat_name = chat_name
+
+	def set_chat_name(self, chat_name: str) -> None:
+		"""Point a pooled instance at another chat before re-pushing it.
+
+		compose() re-runs when the screen is pushed again, so updating the
+		attribute is enough for the label to show the new name.
+		"""
+		self.chat_name = chat_name
 	
 	def compose(self) -> ComposeResult:
 		with Center():
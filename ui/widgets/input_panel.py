@@ -10,7 +10,32 @@ from rich.text import Text
 
 class MessageInput(TextArea):
 	"""Custom TextArea for message input with Enter to send."""
-	
+
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		# Leading-edge guard: True while a send is in flight, so held-key
+		# autorepeat can't dispatch the same message twice before the
+		# event loop yields
+		self._send_inflight = False
+		self._chat_list_panel = None
+		self._conversation_panel = None
+
+	def _get_chat_list_panel(self):
+		"""Resolve the chat list panel once instead of per keystroke."""
+		if self._chat_list_panel is None:
+			self._chat_list_panel = self.app.query_one("#chat-list-panel")
+		return self._chat_list_panel
+
+	def _get_conversation_panel(self):
+		"""Resolve the conversation panel once (lazy, see above)."""
+		if self._conversation_panel is None:
+			self._conversation_panel = self.app.query_one("#conversation-panel")
+		return self._conversation_panel
+
+	def release_send(self) -> None:
+		"""Allow the next Enter to send again (called once a response lands)."""
+		self._send_inflight = False
+
 	async def on_key(self, event: events.Key) -> None:
 		key = event.key  # np. "enter", "return", "shift+enter", "ctrl+c", "a" itd.
 		
@@ -23,6 +48,10 @@ class MessageInput(TextArea):
 		
 		# Enter bez Shift - wyślij wiadomość
 		if key in ("enter", "return"):
+			if self._send_inflight:
+				event.prevent_default()
+				event.stop()
+				return
 			message = self.text.strip()
 			if not message:
 				event.prevent_default()
@@ -33,7 +62,7 @@ class MessageInput(TextArea):
 			if not app:
 				return
 			
-			chat_list_panel = app.query_one("#chat-list-panel")
+			chat_list_panel = self._get_chat_list_panel()
 			chat_data = getattr(chat_list_panel, "get_selected_chat", lambda: None)()
 			
 			if not chat_data:
@@ -44,10 +73,12 @@ class MessageInput(TextArea):
 			chat_name = chat_data["name"]
 			self.text = ""  # wyczyść input po wysłaniu
 			
+			self._send_inflight = True
 			try:
 				app.send_message_to_api(chat_name, message)
 			except Exception as exc:
-				conversation_panel = app.query_one("#conversation-panel")
+				self._send_inflight = False
+				conversation_panel = self._get_conversation_panel()
 				error_text = Text(f"Error calling API: {str(exc)}", style="red")
 				error_widget = Static(error_text, classes="error-message")
 				conversation_container = getattr(conversation_panel, "conversation_container", None)
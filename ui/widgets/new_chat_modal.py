@@ -74,6 +74,13 @@ class NewChatModal(ModalScreen):
 		"""Cancel modal."""
 		self.dismiss(None)
 
+	def reset(self) -> None:
+		"""Clear inputs so a pooled instance opens empty."""
+		if getattr(self, "name_input", None) is not None:
+			self.name_input.value = ""
+		if getattr(self, "system_prompt_input", None) is not None:
+			self.system_prompt_input.text = ""
+
 	def _get_system_prompt_value(self) -> str:
 		"""Return trimmed system prompt text."""
 		if not hasattr(self, "system_prompt_input") or self.system_prompt_input is None: